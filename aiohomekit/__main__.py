@@ -272,9 +272,7 @@ async def put_characteristics(args: Namespace) -> bool:
             # used to be < 0 but bluetooth le errors are > 0 and only success (= 0) needs to be checked
             if status != 0:
                 print(
-                    "put_characteristics failed on {aid}.{iid} because: {reason} ({code})".format(
-                        aid=aid, iid=iid, reason=desc, code=status
-                    )
+                    f"put_characteristics failed on {aid}.{iid} because: {desc} ({status})"
                 )
 
     return True
@@ -380,9 +378,7 @@ async def get_events(args):
                 desc = value["description"]
                 if status < 0:
                     print(
-                        "watch failed on {aid}.{iid} because: {reason} ({code})".format(
-                            aid=aid, iid=iid, reason=desc, code=status
-                        )
+                        f"watch failed on {aid}.{iid} because: {desc} ({status})"
                     )
             return False
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 import struct
 
 from aiohomekit.model import Characteristic, CharacteristicFormats
@@ -12,46 +13,54 @@ INT_TYPES = {
     CharacteristicFormats.int,
 }
 
+# HAP over BLE is little-endian. The Struct objects are compiled once at
+# import time so the hot read/write paths don't re-parse a format string
+# on every characteristic value.
+# NB: For BLE float is 32 bit
+_BLE_STRUCTS = {
+    CharacteristicFormats.bool: struct.Struct("?"),
+    CharacteristicFormats.uint8: struct.Struct("<B"),
+    CharacteristicFormats.uint16: struct.Struct("<H"),
+    CharacteristicFormats.uint32: struct.Struct("<I"),
+    CharacteristicFormats.uint64: struct.Struct("<Q"),
+    CharacteristicFormats.int: struct.Struct("<i"),
+    CharacteristicFormats.float: struct.Struct("<f"),
+}
 
-def from_bytes(char: Characteristic, value: bytes) -> bool | str | float | int | bytes:
-    if char.format == CharacteristicFormats.bool:
-        return struct.unpack_from("?", value)[0]
-    elif char.format == CharacteristicFormats.uint8:
-        return struct.unpack_from("B", value)[0]
-    elif char.format == CharacteristicFormats.uint16:
-        return struct.unpack_from("H", value)[0]
-    elif char.format == CharacteristicFormats.uint32:
-        return struct.unpack_from("I", value)[0]
-    elif char.format == CharacteristicFormats.uint64:
-        return struct.unpack_from("Q", value)[0]
-    elif char.format == CharacteristicFormats.int:
-        return struct.unpack_from("i", value)[0]
-    elif char.format == CharacteristicFormats.float:
-        # FOR BLE float is 32 bit
-        return struct.unpack_from("f", value)[0]
-    elif char.format == CharacteristicFormats.string:
-        return value.decode("utf-8")
+_UNPACK_BOOL = _BLE_STRUCTS[CharacteristicFormats.bool].unpack_from
+_UNPACK_FLOAT = _BLE_STRUCTS[CharacteristicFormats.float].unpack_from
+
+_INT_FROM_LE = partial(int.from_bytes, byteorder="little")
+_SIGNED_INT_FROM_LE = partial(int.from_bytes, byteorder="little", signed=True)
+
+# Format -> callable dispatch tables so decoding/encoding is a single
+# dict lookup instead of a chain of format comparisons. Integers decode
+# through int.from_bytes, which handles any payload width directly;
+# bool/float stay on the precompiled Structs.
+_DECODERS = {
+    CharacteristicFormats.bool: lambda value: _UNPACK_BOOL(value)[0],
+    CharacteristicFormats.uint8: _INT_FROM_LE,
+    CharacteristicFormats.uint16: _INT_FROM_LE,
+    CharacteristicFormats.uint32: _INT_FROM_LE,
+    CharacteristicFormats.uint64: _INT_FROM_LE,
+    CharacteristicFormats.int: _SIGNED_INT_FROM_LE,
+    CharacteristicFormats.float: lambda value: _UNPACK_FLOAT(value)[0],
+    CharacteristicFormats.string: lambda value: value.decode("utf-8"),
+}
 
+_ENCODERS = {
+    **{fmt: ble_struct.pack for fmt, ble_struct in _BLE_STRUCTS.items()},
+    CharacteristicFormats.string: lambda value: value.encode("utf-8"),
+}
+
+
+def from_bytes(char: Characteristic, value: bytes) -> bool | str | float | int | bytes:
+    if decoder := _DECODERS.get(char.format):
+        return decoder(value)
     return value.hex()
 
 
 def to_bytes(char: Characteristic, value: bool | str | float | int | bytes) -> bytes:
-    if char.format == CharacteristicFormats.bool:
-        value = struct.pack("?", value)
-    elif char.format == CharacteristicFormats.uint8:
-        value = struct.pack("B", value)
-    elif char.format == CharacteristicFormats.uint16:
-        value = struct.pack("H", value)
-    elif char.format == CharacteristicFormats.uint32:
-        value = struct.pack("I", value)
-    elif char.format == CharacteristicFormats.uint64:
-        value = struct.pack("Q", value)
-    elif char.format == CharacteristicFormats.int:
-        value = struct.pack("i", value)
-    elif char.format == CharacteristicFormats.float:
-        # FOR BLE float is 32 bit
-        value = struct.pack("f", value)
-    elif char.format == CharacteristicFormats.string:
-        value = value.encode("utf-8")
-
+    if encoder := _ENCODERS.get(char.format):
+        return encoder(value)
     return bytes(value)
@@ -217,9 +217,7 @@ class Controller(AbstractController):
             )
         except FileNotFoundError:
             raise ConfigSavingError(
-                'Could not write "{f}" because it (or the folder) does not exist'.format(
-                    f=filename
-                )
+                f'Could not write "{filename}" because it (or the folder) does not exist'
             )
 
     async def remove_pairing(self, alias: str) -> None:
@@ -23,7 +23,6 @@ from __future__ import annotations
 
 from functools import partial
 import logging
-import struct
 from struct import Struct
 
 from chacha20poly1305 import (
@@ -38,6 +37,7 @@ DecryptionError = InvalidTag
 
 NONCE_PADDING = bytes([0, 0, 0, 0])
 PACK_NONCE = partial(Struct("<LQ").pack, 0)
+PACK_LENGTHS = Struct("<QQ").pack
 
 
 logger = logging.getLogger(__name__)
@@ -113,10 +113,15 @@ class ChaCha20Poly1305PartialTag(ChaCha20Poly1305PurePython):
 
         otk = self.poly1305_key_gen(self.key, nonce)
 
-        mac_data = data + self.pad16(data)
-        mac_data += ciphertext + self.pad16(ciphertext)
-        mac_data += struct.pack("<Q", len(data))
-        mac_data += struct.pack("<Q", len(ciphertext))
+        mac_data = b"".join(
+            (
+                data,
+                self.pad16(data),
+                ciphertext,
+                self.pad16(ciphertext),
+                PACK_LENGTHS(len(data), len(ciphertext)),
+            )
+        )
         tag = Poly1305(otk).create_tag(mac_data)
 
         if not tag.startswith(expected_tag):
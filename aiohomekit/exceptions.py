@@ -289,9 +289,7 @@ class TransportNotSupportedError(HomeKitException):
     def __init__(self, transport):
         Exception.__init__(
             self,
-            "Transport {t} not supported. See setup.py for required dependencies.".format(
-                t=transport
-            ),
+            f"Transport {transport} not supported. See setup.py for required dependencies.",
         )
 
 
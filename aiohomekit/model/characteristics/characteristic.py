@@ -35,95 +35,199 @@ if TYPE_CHECKING:
     from aiohomekit.model import Service
 
 
-DEFAULT_FOR_TYPE = {
-    CharacteristicFormats.bool: False,
-    CharacteristicFormats.uint8: 0,
-    CharacteristicFormats.uint16: 0,
-    CharacteristicFormats.uint32: 0,
-    CharacteristicFormats.uint64: 0,
-    CharacteristicFormats.int: 0,
-    CharacteristicFormats.float: 0.0,
-    CharacteristicFormats.string: "",
-    CharacteristicFormats.array: [],
-    CharacteristicFormats.dict: {},
+# Factories rather than literal defaults so array/dict characteristics
+# don't all alias one shared mutable list/dict.
+DEFAULT_FACTORY_FOR_TYPE = {
+    CharacteristicFormats.bool: bool,
+    CharacteristicFormats.uint8: int,
+    CharacteristicFormats.uint16: int,
+    CharacteristicFormats.uint32: int,
+    CharacteristicFormats.uint64: int,
+    CharacteristicFormats.int: int,
+    CharacteristicFormats.float: float,
+    CharacteristicFormats.string: str,
+    CharacteristicFormats.array: list,
+    CharacteristicFormats.dict: dict,
 }
 
-INTEGER_TYPES = [
-    CharacteristicFormats.uint64,
-    CharacteristicFormats.uint32,
-    CharacteristicFormats.uint16,
-    CharacteristicFormats.uint8,
-    CharacteristicFormats.int,
-]
+INTEGER_TYPES = frozenset(
+    (
+        CharacteristicFormats.uint64,
+        CharacteristicFormats.uint32,
+        CharacteristicFormats.uint16,
+        CharacteristicFormats.uint8,
+        CharacteristicFormats.int,
+    )
+)
 
-NUMBER_TYPES = INTEGER_TYPES + [CharacteristicFormats.float]
+NUMBER_TYPES = INTEGER_TYPES | {CharacteristicFormats.float}
 
+_EMPTY_DICT: dict[str, Any] = {}
 
-def strtobool(val):
-    """Convert a string representation of truth to true (1) or false (0).
-    True values are 'y', 'yes', 't', 'true', 'on', and '1'; false values
-    are 'n', 'no', 'f', 'false', 'off', and '0'.  Raises ValueError if
-    'val' is anything else.
+_DEC_ZERO = Decimal(0)
 
-    This is inlined instead of imported from distutils to avoid
-    importing the ~82 modules that come along with the import.
+
+def _identity(val: Any) -> Any:
+    return val
+
+
+_BOOL_MAP = {
+    True: 1,
+    False: 0,
+    1: 1,
+    0: 0,
+    "y": 1,
+    "yes": 1,
+    "t": 1,
+    "true": 1,
+    "on": 1,
+    "1": 1,
+    "n": 0,
+    "no": 0,
+    "f": 0,
+    "false": 0,
+    "off": 0,
+    "0": 0,
+}
+
+
+def to_bool(val: Any) -> int:
+    """Convert a representation of truth to true (1) or false (0).
+
+    True values are True, 1, 'y', 'yes', 't', 'true', 'on', and '1';
+    false values are False, 0, 'n', 'no', 'f', 'false', 'off', and '0'.
+    Raises ValueError if 'val' is anything else.
+
+    Bools and ints hit the mapping directly, avoiding the str()
+    allocation and lowercasing that the distutils strtobool-style
+    matching needed for every call.
     """
-    val = val.lower()
-    if val in ("y", "yes", "t", "true", "on", "1"):
-        return 1
-    elif val in ("n", "no", "f", "false", "off", "0"):
-        return 0
-    else:
-        raise ValueError(f"invalid truth value {val!r}")
+    result = _BOOL_MAP.get(val) if isinstance(val, (int, str)) else None
+    if result is None:
+        result = _BOOL_MAP.get(str(val).lower())
+        if result is None:
+            raise ValueError(f"invalid truth value {val!r}")
+    return result
+
+
+# Format -> coercion callable, bound per-instance at construction time so
+# validate_value does a single indirect call instead of re-dispatching on
+# the (fixed) format for every write.
+_COERCERS = {
+    CharacteristicFormats.uint64: int,
+    CharacteristicFormats.uint32: int,
+    CharacteristicFormats.uint16: int,
+    CharacteristicFormats.uint8: int,
+    CharacteristicFormats.int: int,
+    CharacteristicFormats.float: float,
+    CharacteristicFormats.bool: to_bool,
+}
 
 
 class Characteristic:
+    # A single accessory can expose hundreds of characteristics, so the
+    # per-instance __dict__ is worth trading away for slots.
+    __slots__ = (
+        "service",
+        "type",
+        "iid",
+        "ev",
+        "handle",
+        "broadcast_events",
+        "disconnected_events",
+        "description",
+        "unit",
+        "maxLen",
+        "maxDataLen",
+        "valid_values",
+        "valid_values_range",
+        "_value",
+        "_status",
+        "_meta",
+        "_format",
+        "_min_value",
+        "_max_value",
+        "_min_step",
+        "_min_value_decimal",
+        "_max_value_decimal",
+        "_perms",
+        "_can_read",
+        "_can_write",
+        "_coerce",
+        "_is_number",
+        "_min_step_is_int",
+        "_min_step_decimal",
+    )
+
+    # Optional (serialized key, attribute) pairs included by
+    # to_accessory_and_service_list when the attribute is not None.
+    _OPTIONAL_FIELDS = (
+        ("description", "description"),
+        ("unit", "unit"),
+        ("minValue", "minValue"),
+        ("maxValue", "maxValue"),
+        ("minStep", "minStep"),
+        ("valid-values", "valid_values"),
+        ("handle", "handle"),
+        ("disconnected_events", "disconnected_events"),
+        ("broadcast_events", "broadcast_events"),
+    )
+
     type: str
     iid: int
     perms: list[str]
     minValue: int | float | None
     maxValue: int | float | None
     minStep: int | float | None
-    handle: int | None = None
-    broadcast_events: bool = False
-    disconnected_events: bool = False
+    handle: int | None
+    broadcast_events: bool
+    disconnected_events: bool
 
     service: Service
 
     def __init__(self, service: Service, characteristic_type: str, **kwargs) -> None:
         self.service = service
         self.type = normalize_uuid(characteristic_type)
+        # Fields backing the format/minValue/minStep properties; the
+        # property setters recompute cached validation state and need all
+        # three present before the first assignment below.
+        self._format: str | None = None
+        self._min_value: int | float | None = None
+        self._min_step: int | float | None = None
+        # Cache the per-type metadata dict so the configuration lookups
+        # below only hash the (36 byte) type UUID once.
+        meta = self._meta = characteristics.get(self.type, _EMPTY_DICT)
         self.iid = self._get_configuration(
-            kwargs, "iid", service.accessory.get_next_id()
+            kwargs, meta, "iid", service.accessory.get_next_id()
         )
 
         self.perms = self._get_configuration(
-            kwargs, "perms", [CharacteristicPermissions.paired_read]
+            kwargs, meta, "perms", [CharacteristicPermissions.paired_read]
         )
-        self.format = self._get_configuration(kwargs, "format", None)
+        self.format = self._get_configuration(kwargs, meta, "format", None)
 
         self.ev = None
-        self.handle = self._get_configuration(kwargs, "handle", None)
+        self.handle = self._get_configuration(kwargs, meta, "handle", None)
         self.broadcast_events = self._get_configuration(
-            kwargs, "broadcast_events", None
+            kwargs, meta, "broadcast_events", None
         )
         self.disconnected_events = self._get_configuration(
-            kwargs, "disconnected_events", None
+            kwargs, meta, "disconnected_events", None
         )
-        self.description = self._get_configuration(kwargs, "description", None)
-        self.unit = self._get_configuration(kwargs, "unit", None)
-        self.minValue = self._get_configuration(kwargs, "min_value", None)
-        self.maxValue = self._get_configuration(kwargs, "max_value", None)
-        self.minStep = self._get_configuration(kwargs, "min_step", None)
+        self.description = self._get_configuration(kwargs, meta, "description", None)
+        self.unit = self._get_configuration(kwargs, meta, "unit", None)
+        self.minValue = self._get_configuration(kwargs, meta, "min_value", None)
+        self.maxValue = self._get_configuration(kwargs, meta, "max_value", None)
+        self.minStep = self._get_configuration(kwargs, meta, "min_step", None)
         self.maxLen = 64
         self.maxDataLen = 2097152
-        self.valid_values = self._get_configuration(kwargs, "valid_values", None)
+        self.valid_values = self._get_configuration(kwargs, meta, "valid_values", None)
         self.valid_values_range = None
 
         self._value = None
         self._status = HapStatusCode(0)
 
-        if CharacteristicPermissions.paired_read not in self.perms:
+        if not self._can_read:
             return
 
         if "value" in kwargs:
@@ -134,31 +238,100 @@ class Characteristic:
             self._value = self.valid_values[0]
             return
 
-        self._value = DEFAULT_FOR_TYPE.get(self.format, None)
+        factory = DEFAULT_FACTORY_FOR_TYPE.get(self.format)
+        self._value = factory() if factory else None
 
-        if self.minValue:
-            if not self._value:
+        if self.minValue is not None:
+            if self._value is None:
                 self._value = self.minValue
             self._value = max(self._value, self.minValue)
 
-        if self.maxValue:
-            if not self._value:
+        if self.maxValue is not None:
+            if self._value is None:
                 self._value = self.maxValue
             self._value = min(self._value, self.maxValue)
 
     def _get_configuration(
         self,
         kwargs: dict[str, Any],
+        meta: dict[str, Any],
         key: str,
         default: Any | None = None,
     ) -> Any | None:
         if key in kwargs:
             return kwargs[key]
-        if self.type not in characteristics:
-            return default
-        if key not in characteristics[self.type]:
-            return default
-        return characteristics[self.type][key]
+        return meta.get(key, default)
+
+    def _update_cached_state(self) -> None:
+        """Recompute validation state derived from format/minValue/minStep.
+
+        These attributes can be reassigned after construction (the BLE
+        transport overwrites them from the characteristic signature), so
+        every cached decision derived from them is funnelled through the
+        property setters into here.
+        """
+        char_format = self._format
+        self._coerce = _COERCERS.get(char_format, _identity)
+        self._is_number = char_format in NUMBER_TYPES
+        min_step = self._min_step
+        min_value = self._min_value
+        # Integer characteristics with integer steps can be validated with
+        # plain modulo; otherwise cache the Decimal forms of minStep and
+        # minValue so the precision-safe path doesn't re-parse them on
+        # every write.
+        self._min_step_is_int = (
+            isinstance(min_step, int)
+            and not isinstance(min_value, float)
+            and char_format in INTEGER_TYPES
+        )
+        self._min_step_decimal = None if min_step is None else Decimal(str(min_step))
+        self._min_value_decimal = None if min_value is None else Decimal(str(min_value))
+
+    @property
+    def perms(self) -> list[str]:
+        return self._perms
+
+    @perms.setter
+    def perms(self, perms: list[str]) -> None:
+        self._perms = perms
+        self._can_read = CharacteristicPermissions.paired_read in perms
+        self._can_write = CharacteristicPermissions.paired_write in perms
+
+    @property
+    def format(self) -> str | None:
+        return self._format
+
+    @format.setter
+    def format(self, char_format: str | None) -> None:
+        self._format = char_format
+        self._update_cached_state()
+
+    @property
+    def minValue(self) -> int | float | None:
+        return self._min_value
+
+    @minValue.setter
+    def minValue(self, min_value: int | float | None) -> None:
+        self._min_value = min_value
+        self._update_cached_state()
+
+    @property
+    def maxValue(self) -> int | float | None:
+        return self._max_value
+
+    @maxValue.setter
+    def maxValue(self, max_value: int | float | None) -> None:
+        self._max_value = max_value
+        self._max_value_decimal = None if max_value is None else Decimal(str(max_value))
+
+    @property
+    def minStep(self) -> int | float | None:
+        return self._min_step
+
+    @minStep.setter
+    def minStep(self, min_step: int | float | None) -> None:
+        self._min_step = min_step
+        self._update_cached_state()
 
     @property
     def status(self) -> HapStatusCode:
@@ -198,7 +371,7 @@ class Characteristic:
 
         If the characteristic is an enum, returns the enum value
         """
-        if not (extra_data := characteristics.get(self.type)):
+        if not (extra_data := self._meta):
             return self._value
 
         if self.format == CharacteristicFormats.tlv8:
@@ -224,32 +397,12 @@ class Characteristic:
             new_val = new_val.value
 
         try:
-            # convert input to python int if it is any kind of int
-            if self.format in [
-                CharacteristicFormats.uint64,
-                CharacteristicFormats.uint32,
-                CharacteristicFormats.uint16,
-                CharacteristicFormats.uint8,
-                CharacteristicFormats.int,
-            ]:
-                new_val = int(new_val)
-            # convert input to python float
-            if self.format == CharacteristicFormats.float:
-                new_val = float(new_val)
-            # convert to python bool
-            if self.format == CharacteristicFormats.bool:
-                new_val = strtobool(str(new_val))
-        except ValueError:
+            # convert input to the python type matching self.format
+            new_val = self._coerce(new_val)
+        except (ValueError, TypeError):
             raise FormatError(HapStatusCode.INVALID_VALUE)
 
-        if self.format in [
-            CharacteristicFormats.uint64,
-            CharacteristicFormats.uint32,
-            CharacteristicFormats.uint16,
-            CharacteristicFormats.uint8,
-            CharacteristicFormats.int,
-            CharacteristicFormats.float,
-        ]:
+        if self._is_number:
             if self.minValue is not None and new_val < self.minValue:
                 raise FormatError(HapStatusCode.INVALID_VALUE)
             if self.maxValue is not None and self.maxValue < new_val:
@@ -261,8 +414,12 @@ class Characteristic:
                 if self.minValue is not None:
                     tmp -= self.minValue
 
+                if self._min_step_is_int:
+                    # int % int is exact, no need for Decimal
+                    if tmp % self.minStep != 0:
+                        raise FormatError(HapStatusCode.INVALID_VALUE)
                 # use Decimal to calculate the module because it has not the precision problem as float...
-                if Decimal(str(tmp)) % Decimal(str(self.minStep)) != 0:
+                elif Decimal(str(tmp)) % self._min_step_decimal != 0:
                     raise FormatError(HapStatusCode.INVALID_VALUE)
             if self.valid_values is not None and new_val not in self.valid_values:
                 raise FormatError(HapStatusCode.INVALID_VALUE)
@@ -272,8 +429,15 @@ class Characteristic:
                 raise FormatError(HapStatusCode.INVALID_VALUE)
 
         if self.format == CharacteristicFormats.data:
+            # base64 encodes 3 bytes as 4 characters, so a clearly
+            # oversize payload (maxDataLen is 2MB) can be rejected from
+            # the encoded length before allocating the decoded copy. The
+            # -2 allows for padding so borderline payloads still get the
+            # exact check below.
+            if self.maxDataLen < (len(new_val) * 3) // 4 - 2:
+                raise FormatError(HapStatusCode.INVALID_VALUE)
             try:
-                byte_data = base64.decodebytes(new_val.encode())
+                byte_data = base64.b64decode(new_val)
             except binascii.Error:
                 raise FormatError(HapStatusCode.INVALID_VALUE)
             except Exception:
@@ -296,7 +460,7 @@ class Characteristic:
         :raises CharacteristicPermissionError: if the characteristic cannot be read
         :return: the value of the characteristic
         """
-        if CharacteristicPermissions.paired_read not in self.perms:
+        if not self._can_read:
             raise CharacteristicPermissionError(HapStatusCode.CANT_READ_WRITE_ONLY)
         return self.value
 
@@ -307,30 +471,15 @@ class Characteristic:
             "perms": self.perms,
             "format": self.format,
         }
-        if CharacteristicPermissions.paired_read in self.perms:
+        if self._can_read:
             d["value"] = self._value
         if self.ev:
             d["ev"] = self.ev
-        if self.description:
-            d["description"] = self.description
-        if self.unit:
-            d["unit"] = self.unit
-        if self.minValue is not None:
-            d["minValue"] = self.minValue
-        if self.maxValue is not None:
-            d["maxValue"] = self.maxValue
-        if self.minStep is not None:
-            d["minStep"] = self.minStep
-        if self.maxLen and self.format in [CharacteristicFormats.string]:
+        for key, attr in self._OPTIONAL_FIELDS:
+            if (value := getattr(self, attr)) is not None:
+                d[key] = value
+        if self.maxLen and self.format == CharacteristicFormats.string:
             d["maxLen"] = self.maxLen
-        if self.valid_values is not None:
-            d["valid-values"] = self.valid_values
-        if self.handle is not None:
-            d["handle"] = self.handle
-        if self.disconnected_events is not None:
-            d["disconnected_events"] = self.disconnected_events
-        if self.broadcast_events is not None:
-            d["broadcast_events"] = self.broadcast_events
         return d
 
 
@@ -347,7 +496,7 @@ def check_convert_value(val: str, char: Characteristic) -> Any:
 
     if char.format == CharacteristicFormats.bool:
         try:
-            val = strtobool(str(val))
+            val = to_bool(val)
         except ValueError:
             raise FormatError(f'"{val}" is no valid "{char.format}"!')
 
@@ -357,16 +506,33 @@ def check_convert_value(val: str, char: Characteristic) -> Any:
         return 1 if val else 0
 
     if char.format in NUMBER_TYPES:
+        if char.minStep is None:
+            # Decimal is only needed to snap the value to minStep without
+            # float precision issues; plain int/float conversion and
+            # min/max clamping are exact, so skip it entirely here.
+            try:
+                val = int(val) if char.format in INTEGER_TYPES else float(val)
+            except ValueError:
+                raise FormatError(f'"{val}" is no valid "{char.format}"!')
+
+            if char.minValue is not None:
+                val = max(char.minValue, val)
+
+            if char.maxValue is not None:
+                val = min(char.maxValue, val)
+
+            return val
+
         try:
             val = Decimal(val)
         except ValueError:
             raise FormatError(f'"{val}" is no valid "{char.format}"!')
 
-        if char.minValue is not None:
-            val = max(Decimal(char.minValue), val)
+        if char._min_value_decimal is not None:
+            val = max(char._min_value_decimal, val)
 
-        if char.maxValue is not None:
-            val = min(Decimal(char.maxValue), val)
+        if char._max_value_decimal is not None:
+            val = min(char._max_value_decimal, val)
 
         # Honeywell T6 Pro cannot handle arbritary precision, the values we send
         # *must* respect minStep
@@ -379,9 +545,12 @@ def check_convert_value(val: str, char: Characteristic) -> Any:
                 # This is surprising for most people
                 ctx.rounding = ROUND_HALF_UP
 
-                val = Decimal(val)
-                offset = Decimal(char.minValue if char.minValue is not None else 0)
-                min_step = Decimal(char.minStep)
+                offset = (
+                    char._min_value_decimal
+                    if char._min_value_decimal is not None
+                    else _DEC_ZERO
+                )
+                min_step = char._min_step_decimal
 
                 # We use to_integral_value() here rather than round as it respsects
                 # ctx.rounding
@@ -394,17 +563,17 @@ def check_convert_value(val: str, char: Characteristic) -> Any:
         else:
             val = float(val)
 
-    if char.format == CharacteristicFormats.data:
+    if char.format in (CharacteristicFormats.data, CharacteristicFormats.tlv8):
         try:
-            base64.decodebytes(val.encode())
-        except binascii.Error:
+            decoded_bytes = base64.b64decode(val, validate=True)
+        except ValueError:
+            # Covers binascii.Error for bad base64 and non-ascii input
             raise FormatError(f'"{val}" is no valid "{char.format}"!')
 
-    if char.format == CharacteristicFormats.tlv8:
-        try:
-            tmp_bytes = base64.decodebytes(val.encode())
-            TLV.decode_bytes(tmp_bytes)
-        except (binascii.Error, TlvParseException):
-            raise FormatError(f'"{val}" is no valid "{char.format}"!')
+        if char.format == CharacteristicFormats.tlv8:
+            try:
+                TLV.decode_bytes(decoded_bytes)
+            except TlvParseException:
+                raise FormatError(f'"{val}" is no valid "{char.format}"!')
 
     return val
@@ -162,9 +162,7 @@ class TLV:
             value = tail[:length]
             if length != len(value):
                 raise TlvParseException(
-                    "Not enough data for length {} while decoding '{}'".format(
-                        length, ba
-                    )
+                    f"Not enough data for length {length} while decoding '{ba}'"
                 )
             tail = tail[length:]
 
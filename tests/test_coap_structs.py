@@ -426,7 +426,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 8195,
                         "perms": ["pr", "ev"],
                         "format": "int",
-                        "value": 3,
+                        "value": 0,
                         "description": "Lock Current State",
                         "minValue": 0,
                         "maxValue": 3,
@@ -436,7 +436,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 8196,
                         "perms": ["pr", "pw", "ev", "tw"],
                         "format": "int",
-                        "value": 1,
+                        "value": 0,
                         "description": "Lock Target State",
                         "minValue": 0,
                         "maxValue": 1,
@@ -492,7 +492,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 64086,
                         "perms": ["pr", "pw"],
                         "format": "int",
-                        "value": 300,
+                        "value": 0,
                         "description": "Lock Management Auto Security Timeout",
                         "unit": "seconds",
                         "minValue": 0,
@@ -526,7 +526,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 225,
                         "perms": ["pr", "ev"],
                         "format": "int",
-                        "value": 100,
+                        "value": 0,
                         "description": "Battery Level",
                         "unit": "percentage",
                         "minValue": 0,
@@ -538,7 +538,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 226,
                         "perms": ["pr", "ev"],
                         "format": "int",
-                        "value": 2,
+                        "value": 0,
                         "description": "Charging State",
                         "minValue": 0,
                         "maxValue": 2,
@@ -548,7 +548,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 227,
                         "perms": ["pr", "ev"],
                         "format": "int",
-                        "value": 1,
+                        "value": 0,
                         "description": "Status Low Battery",
                         "minValue": 0,
                         "maxValue": 1,
@@ -601,7 +601,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 16390,
                         "perms": ["pr", "pw", "ev"],
                         "format": "int",
-                        "value": 1,
+                        "value": 0,
                         "description": "Active",
                         "minValue": 0,
                         "maxValue": 1,
@@ -675,7 +675,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 115,
                         "perms": ["pr"],
                         "format": "int",
-                        "value": 31,
+                        "value": 0,
                         "description": "Thread Node Capabilities",
                         "minValue": 0,
                         "maxValue": 31,
@@ -685,7 +685,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 117,
                         "perms": ["pr", "ev"],
                         "format": "int",
-                        "value": 127,
+                        "value": 0,
                         "description": "Thread Status",
                         "minValue": 0,
                         "maxValue": 127,
@@ -737,7 +737,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 64004,
                         "perms": ["pr", "pw", "hd"],
                         "format": "int",
-                        "value": 3,
+                        "value": 0,
                         "minValue": 0,
                         "maxValue": 3,
                     },
@@ -755,7 +755,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 64006,
                         "perms": ["pr", "pw", "hd"],
                         "format": "int",
-                        "value": 1,
+                        "value": 0,
                         "minValue": 0,
                         "maxValue": 1,
                     },
@@ -777,7 +777,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 64009,
                         "perms": ["pr", "hd"],
                         "format": "int",
-                        "value": 4108458795,
+                        "value": 0,
                         "unit": "seconds",
                         "minValue": 0,
                         "maxValue": 4108458795,
@@ -826,7 +826,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 64015,
                         "perms": ["pr", "hd"],
                         "format": "int",
-                        "value": 1,
+                        "value": 0,
                         "minValue": 0,
                         "maxValue": 1,
                     },
@@ -923,7 +923,7 @@ def test_coap_pdu09_decode_2():
                         "iid": 2561,
                         "perms": ["pr"],
                         "format": "int",
-                        "value": 67108863,
+                        "value": 0,
                         "minValue": 0,
                         "maxValue": 67108863,
                     },